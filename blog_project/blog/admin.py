@@ -9,24 +9,18 @@ class PostAdmin(admin.ModelAdmin):
 
     Позволяет:
     - Просматривать, фильтровать, искать и редактировать посты.
-    - Считывать и отображать количество лайков, дизлайков и рейтинг.
+    - Отображать денормализованные счетчики лайков, дизлайков и рейтинг.
     """
     list_display = ('title', 'author', 'category', 'time_create', 'views', 'like_count', 'dislike_count', 'rating')
     list_filter = ('category', 'author')
     search_fields = ('title', 'content')
     ordering = ('-time_create',)
 
-    def like_count(self, obj):
-        """Подсчитывает количество лайков для поста."""
-        return obj.like_count()
+    readonly_fields = ('like_count', 'dislike_count')
 
-    def dislike_count(self, obj):
-        """Подсчитывает количество дизлайков для поста."""
-        return obj.dislike_count()
-
-    def rating(self, obj):
-        """Вычисляет рейтинг поста на основе лайков и дизлайков."""
-        return obj.rating()
+    def get_queryset(self, request):
+        """Подгружает автора и категорию одним JOIN-запросом."""
+        return super().get_queryset(request).select_related('author', 'category')
 
 class CategoryAdmin(admin.ModelAdmin):
     """
@@ -46,6 +40,7 @@ class CommentAdmin(admin.ModelAdmin):
     - Просматривать, фильтровать и искать комментарии.
     """
     list_display = ('post', 'author', 'content', 'created_at')
+    list_select_related = ('post', 'author')
     list_filter = ('post', 'author', 'created_at')
     search_fields = ('content',)
 
@@ -67,10 +62,30 @@ class LikeAdmin(admin.ModelAdmin):
     """
     form = LikeForm
     list_display = ('user', 'post', 'is_like')
+    list_select_related = ('user', 'post')
     list_filter = ('is_like',)
     search_fields = ('user__username', 'post__title')
     list_editable = ['is_like']
 
+    def get_queryset(self, request):
+        """
+        Подгружает пользователя и пост одним JOIN-запросом,
+        в том числе для форм list_editable.
+        """
+        return super().get_queryset(request).select_related('user', 'post')
+
+    def save_model(self, request, obj, form, change):
+        """
+        Сохраняет лайк и пересчитывает счетчики поста.
+
+        Создание и удаление лайков учитываются сигналами post_save и post_delete, а при изменении оценки
+        или поста прежнее значение сигналу неизвестно, поэтому счетчики пересчитываются здесь.
+        """
+        super().save_model(request, obj, form, change)
+        obj.post.recount_likes()
+        if 'post' in form.initial and form.initial['post'] != obj.post_id:
+            Post.objects.get(pk=form.initial['post']).recount_likes()
+
 # Регистрация моделей в админке
 admin.site.register(Post, PostAdmin)
 admin.site.register(Category, CategoryAdmin)
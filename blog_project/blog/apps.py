@@ -9,3 +9,7 @@ class BlogConfig(AppConfig):
     """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
+
+    def ready(self):
+        """Подключает обработчики сигналов приложения."""
+        import blog.signals  # noqa: F401
@@ -0,0 +1,124 @@
+import copy
+import hashlib
+import threading
+import time
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+
+class TTLCache:
+    """
+    Потокобезопасный кеш в памяти процесса с временем жизни записей.
+
+    При достижении maxsize кеш очищается целиком: записи живут недолго,
+    поэтому точное вытеснение не требуется.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = {}  # ключ -> (момент истечения, значение)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Возвращает значение по ключу или None, если записи нет или она истекла."""
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key, value, timeout):
+        """Сохраняет значение на timeout секунд."""
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (time.monotonic() + timeout, value)
+
+    def delete_matching(self, predicate):
+        """Удаляет записи, для ключей которых predicate возвращает True."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        """Очищает кеш."""
+        with self._lock:
+            self._data.clear()
+
+
+# Пользователи, загруженные по JWT: (ID пользователя, claim отзыва токена) -> пользователь
+_user_cache = TTLCache(maxsize=1024)
+
+# Проверенные токены: хеш токена -> объект токена
+_token_cache = TTLCache(maxsize=10000)
+
+
+def clear_user_cache(user_id=None):
+    """
+    Очищает кеш пользователей JWT-аутентификации.
+
+    Аргументы:
+    - user_id: ID пользователя, записи которого нужно удалить. Если не указан, кеш очищается полностью.
+    """
+    if user_id is None:
+        _user_cache.clear()
+        return
+    _user_cache.delete_matching(lambda key: str(key[0]) == str(user_id))
+
+
+def clear_token_cache():
+    """Очищает кеш проверенных JWT-токенов."""
+    _token_cache.clear()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT-аутентификация с кешированием проверенных токенов и пользователей.
+
+    Проверенный токен хранится в памяти процесса не дольше TOKEN_CACHE_TIMEOUT секунд и не дольше
+    срока его действия, поэтому повторные запросы с тем же токеном не проверяют подпись заново.
+
+    Пользователь, найденный по токену, хранится в памяти процесса в течение USER_CACHE_TIMEOUT секунд,
+    поэтому частые запросы с токенами того же пользователя не выполняют SELECT по таблице пользователей.
+    Проверки активности пользователя и отзыва токена выполняются при загрузке пользователя из БД.
+    При сохранении пользователя его записи удаляются из кеша только в том процессе, где он сохранен:
+    изменения, сделанные в другом процессе (например, деактивация в админке, обслуживаемой
+    отдельно через blog_project.urls_ops), вступают в силу в процессах API с задержкой
+    до USER_CACHE_TIMEOUT секунд, поэтому это время держим коротким.
+    """
+    TOKEN_CACHE_TIMEOUT = 5
+    USER_CACHE_TIMEOUT = 3
+
+    def get_validated_token(self, raw_token):
+        """
+        Возвращает проверенный токен, используя кеш процесса.
+
+        Ключом служит хеш токена, поэтому сами токены в памяти не хранятся.
+        """
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        token = _token_cache.get(key)
+        if token is not None:
+            return token
+
+        token = super().get_validated_token(raw_token)
+        timeout = min(self.TOKEN_CACHE_TIMEOUT, token.get('exp', 0) - time.time())
+        if timeout > 0:
+            _token_cache.set(key, token, timeout)
+        return token
+
+    def get_user(self, validated_token):
+        """
+        Возвращает пользователя по токену, используя кеш процесса.
+
+        Каждому запросу отдается копия закешированного объекта, чтобы изменения
+        пользователя в одном запросе не влияли на другие.
+        """
+        key = (
+            validated_token.get(api_settings.USER_ID_CLAIM),
+            validated_token.get(api_settings.REVOKE_TOKEN_CLAIM),
+        )
+        user = _user_cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            _user_cache.set(key, user, self.USER_CACHE_TIMEOUT)
+        return copy.copy(user)
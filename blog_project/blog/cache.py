@@ -0,0 +1,47 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+POSTS_LIST_VERSION_KEY = 'posts_list_version'
+
+
+def post_cache_key(post_id):
+    """Возвращает ключ кеша для подробной информации о посте."""
+    return f'post_detail_{post_id}'
+
+
+def posts_list_cache_version():
+    """
+    Возвращает текущую версию кеша списка постов.
+
+    Версия входит в ключи закешированных страниц списка, поэтому ее увеличение
+    сразу делает устаревшими все страницы без перебора ключей.
+    Если ключа версии нет (например, его вытеснил Redis), начальной версией становится текущее время
+    в наносекундах: она больше любой прежней версии, и еще живые страницы прежних версий не вернутся.
+    """
+    return cache.get_or_set(POSTS_LIST_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def invalidate_posts_list_cache():
+    """Увеличивает версию кеша списка постов, инвалидируя все его страницы."""
+    try:
+        cache.incr(POSTS_LIST_VERSION_KEY)
+    except ValueError:
+        # Ключа версии нет в кеше (например, после очистки или вытеснения): начинаем с версии,
+        # которая не повторяет прежние (см. posts_list_cache_version)
+        cache.set(POSTS_LIST_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def invalidate_post_caches_on_commit(post_id):
+    """
+    Удаляет пост из кеша и инвалидирует кеш списка постов после фиксации текущей транзакции.
+
+    Если сбросить кеш до фиксации, параллельный запрос успеет прочитать еще не измененные данные
+    и снова закешировать их (а для поста — и их ETag). Вне транзакции кеш сбрасывается сразу.
+    """
+    def invalidate():
+        cache.delete(post_cache_key(post_id))
+        invalidate_posts_list_cache()
+
+    transaction.on_commit(invalidate)
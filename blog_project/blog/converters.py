@@ -0,0 +1,16 @@
+from functools import lru_cache
+
+
+class FastIntConverter:
+    """
+    Конвертер целочисленных ID в URL-путях.
+
+    Работает так же, как встроенный конвертер int, но результат разбора кешируется
+    по строке пути: ID популярных постов повторяются из запроса в запрос.
+    Для формирования URL используется str без дополнительной обертки.
+    """
+    regex = '[0-9]+'
+
+    # Размер кеша ограничен, чтобы перебор ID не увеличивал потребление памяти
+    to_python = staticmethod(lru_cache(maxsize=1024)(int))
+    to_url = staticmethod(str)
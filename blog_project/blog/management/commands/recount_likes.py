@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    """
+    Команда пересчета счетчиков лайков и дизлайков.
+
+    Этот класс пересчитывает денормализованные счетчики всех постов по таблице лайков.
+    Запускается один раз после добавления счетчиков, чтобы заполнить их для существующих постов,
+    а также при подозрении на расхождение счетчиков с таблицей лайков.
+    """
+    help = 'Пересчитывает счетчики лайков и дизлайков всех постов по таблице лайков'
+
+    def handle(self, *args, **options):
+        """Пересчитывает счетчики каждого поста и выводит количество обработанных постов."""
+        count = 0
+        for post in Post.objects.only('pk').iterator():
+            post.recount_likes()
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Счетчики пересчитаны для постов: {count}'))
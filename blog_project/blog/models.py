@@ -1,5 +1,8 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models.functions import Upper
+
+from blog.cache import invalidate_post_caches_on_commit
 
 class Post(models.Model):
     """
@@ -7,39 +10,68 @@ class Post(models.Model):
 
     Позволяет:
     - Хранить заголовок, контент, дату создания и обновления.
-    - Отображать количество лайков и дизлайков.
-    - Вычислять рейтинг на основе лайков и дизлайков.
+    - Хранить денормализованные счетчики лайков и дизлайков.
+    - Вычислять рейтинг на основе лайков и дизлайков на стороне БД.
     """
     title = models.CharField(max_length=100)
     content = models.TextField(max_length=255, blank=True)
-    time_create = models.DateField(auto_now_add=True)
-    time_update = models.DateField(auto_now=True)
+    time_create = models.DateTimeField(auto_now_add=True, db_index=True)
+    time_update = models.DateTimeField(auto_now=True)
     category = models.ForeignKey('Category', on_delete=models.PROTECT, null=True)
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     views = models.PositiveIntegerField(default=0)
+    like_count = models.PositiveIntegerField(default=0)
+    dislike_count = models.PositiveIntegerField(default=0)
+    rating = models.GeneratedField(
+        expression=models.F('like_count') - models.F('dislike_count'),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
+    # Счетчики, которые меняются только атомарными UPDATE через F-выражения
+    COUNTER_FIELDS = ('views', 'like_count', 'dislike_count')
 
     def __str__(self):
         """Возвращает заголовок поста."""
         return self.title
 
-    def increase_views(self):
-        """Увеличивает количество просмотров поста на 1."""
-        self.views += 1
-        self.save()
+    def save(self, *args, **kwargs):
+        """
+        Сохраняет пост.
+
+        При обновлении существующего поста без явного update_fields счетчики не записываются:
+        иначе значения, прочитанные при загрузке поста, затерли бы голоса и просмотры,
+        учтенные параллельными запросами после загрузки.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
-    def like_count(self):
-        """Подсчитывает количество лайков поста."""
-        return self.likes.filter(is_like=True).count()
+    def increase_views(self):
+        """
+        Увеличивает количество просмотров поста на 1.
 
-    def dislike_count(self):
-        """Подсчитывает количество дизлайков поста."""
-        return self.likes.filter(is_like=False).count()
+        Счетчик увеличивается атомарным UPDATE через F-выражение, без перезаписи всей строки.
+        """
+        Post.objects.filter(pk=self.pk).update(views=models.F('views') + 1)
+        self.views += 1
 
-    def rating(self):
+    def recount_likes(self):
         """
-        Вычисляет рейтинг поста как разницу между количеством лайков и дизлайков.
+        Пересчитывает счетчики лайков и дизлайков поста по таблице лайков.
+
+        Используется там, где лайки меняются в обход LikeAPIView (например, в админке),
+        и командой recount_likes. Кеш поста и списка постов сбрасывается после фиксации транзакции.
         """
-        return self.like_count() - self.dislike_count()
+        counts = self.likes.aggregate(
+            like_count=models.Count('id', filter=models.Q(is_like=True)),
+            dislike_count=models.Count('id', filter=models.Q(is_like=False)),
+        )
+        Post.objects.filter(pk=self.pk).update(**counts)
+        invalidate_post_caches_on_commit(self.pk)
 
 class Category(models.Model):
     """
@@ -50,6 +82,12 @@ class Category(models.Model):
     """
     name = models.CharField(max_length=100)
 
+    class Meta:
+        indexes = [
+            # Фильтр по названию (iexact) сравнивает UPPER(name) на PostgreSQL
+            models.Index(Upper('name'), name='category_name_upper_idx'),
+        ]
+
     def __str__(self):
         """Возвращает название категории."""
         return self.name
@@ -77,12 +115,19 @@ class Like(models.Model):
     Позволяет:
     - Хранить информацию о том, какой пользователь лайкнул/дизлайкнул пост.
     """
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
-    post = models.ForeignKey(Post, related_name='likes', on_delete=models.CASCADE)
+    # Отдельные индексы внешних ключей не нужны: user покрывает уникальный индекс (user, post),
+    # а post — составной индекс (post, is_like) из Meta
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+    post = models.ForeignKey(Post, related_name='likes', on_delete=models.CASCADE, db_index=False)
     is_like = models.BooleanField()  # True - лайк, False - дизлайк
 
     class Meta:
         unique_together = ('user', 'post')  # Ограничиваем, чтобы пользователь не мог лайкать пост несколько раз
+        indexes = [
+            # Заменяет индекс внешнего ключа post: обслуживает выборку и каскадное удаление лайков поста,
+            # а также подсчет лайков и дизлайков в recount_likes по одному индексу
+            models.Index(fields=['post', 'is_like'], name='like_post_is_like_idx'),
+        ]
 
     def __str__(self):
         """Возвращает строковое представление лайка/дизлайка."""
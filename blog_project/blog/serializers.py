@@ -22,7 +22,7 @@ class PostSerializer(serializers.ModelSerializer):
     Поля "views", "like_count", "dislike_count" и "rating" доступны только для чтения.
     """
     category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all())
-    author = serializers.StringRelatedField()
+    author = serializers.SlugRelatedField(slug_field='username', read_only=True)
     like_count = serializers.IntegerField(read_only=True)
     dislike_count = serializers.IntegerField(read_only=True)
     rating = serializers.IntegerField(read_only=True)  # Для отображения рейтинга
@@ -33,6 +33,21 @@ class PostSerializer(serializers.ModelSerializer):
         read_only_fields = ['views', 'like_count', 'dislike_count', 'rating']
 
 
+class PostListSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор для списка постов.
+
+    Этот сериализатор используется на эндпоинте списка постов и не включает контент поста,
+    чтобы не загружать его из базы данных для каждой строки. Все поля доступны только для чтения.
+    """
+    author = serializers.SlugRelatedField(slug_field='username', read_only=True)
+
+    class Meta:
+        model = Post
+        fields = ['id', 'title', 'category', 'author', 'time_create', 'views', 'like_count', 'dislike_count', 'rating']
+        read_only_fields = fields
+
+
 class CommentSerializer(serializers.ModelSerializer):
     """
     Сериализатор для модели Comment.
@@ -40,7 +55,7 @@ class CommentSerializer(serializers.ModelSerializer):
     Этот сериализатор используется для отображения информации о комментариях,
     включая имя автора, и другие поля комментария.
     """
-    author = serializers.StringRelatedField(read_only=True)  # Отображаем имя автора
+    author = serializers.SlugRelatedField(slug_field='username', read_only=True)  # Отображаем имя автора
 
     class Meta:
         model = Comment
@@ -60,39 +75,3 @@ class LikeSerializer(serializers.ModelSerializer):
         model = Like
         fields = ['user', 'post', 'is_like']
         read_only_fields = ['user', 'post']
-
-
-class PostLikeCountSerializer(serializers.ModelSerializer):
-    """
-    Сериализатор для подсчета лайков и дизлайков на постах.
-
-    Этот сериализатор используется для отображения количества лайков и дизлайков
-    для каждого поста. Данные собираются динамически через фильтрацию лайков.
-    """
-    like_count = serializers.IntegerField(read_only=True)
-    dislike_count = serializers.IntegerField(read_only=True)
-
-    class Meta:
-        model = Post
-        fields = ['id', 'title', 'like_count', 'dislike_count']
-
-    def to_representation(self, instance):
-        """
-        Переопределённый метод для сериализации данных.
-
-        В этом методе добавляется подсчёт лайков и дизлайков для поста.
-        Сначала вызывается стандартная сериализация объекта, затем добавляются два дополнительных поля:
-        - `like_count`: количество лайков.
-        - `dislike_count`: количество дизлайков.
-
-        Аргументы:
-        - instance: Экземпляр объекта модели, который будет сериализован.
-
-        Возвращаемое значение:
-        - Возвращает сериализованные данные объекта с дополнительной информацией о лайках и дизлайках.
-        """
-        representation = super().to_representation(instance)
-        # Подсчитываем лайки и дизлайки
-        representation['like_count'] = instance.likes.filter(is_like=True).count()
-        representation['dislike_count'] = instance.likes.filter(is_like=False).count()
-        return representation
@@ -0,0 +1,59 @@
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from blog.authentication import clear_user_cache
+from blog.cache import invalidate_post_caches_on_commit
+from blog.models import Post, Like
+
+
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_post_cache_on_change(sender, instance, **kwargs):
+    """Удаляет пост из кеша и инвалидирует кеш списка постов при изменении поста (после фиксации транзакции)."""
+    invalidate_post_caches_on_commit(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Like)
+def invalidate_liked_post_cache_on_change(sender, instance, **kwargs):
+    """
+    Удаляет оцененный пост из кеша и инвалидирует кеш списка постов при изменении лайка
+    (после фиксации транзакции).
+    """
+    invalidate_post_caches_on_commit(instance.post_id)
+
+
+@receiver(post_save, sender=Like)
+def increase_post_counters_on_like_create(sender, instance, created, **kwargs):
+    """
+    Увеличивает счетчик лайков или дизлайков поста при создании лайка.
+
+    Вместе с decrease_post_counters_on_like_delete держит счетчики в соответствии с таблицей лайков
+    при любом создании и удалении через ORM (API, админка, shell, get_or_create). Изменение оценки
+    существующего лайка счетчики не меняет: его учитывают LikeAPIView и LikeAdmin.
+    При загрузке фикстур (raw) счетчики не меняются: они загружаются вместе с постами.
+    bulk_create и queryset.update() сигналы не вызывают — после них нужна команда recount_likes.
+    """
+    if not created or kwargs.get('raw'):
+        return
+    field = 'like_count' if instance.is_like else 'dislike_count'
+    Post.objects.filter(pk=instance.post_id).update(**{field: F(field) + 1})
+
+
+@receiver(post_delete, sender=Like)
+def decrease_post_counters_on_like_delete(sender, instance, **kwargs):
+    """
+    Уменьшает счетчик лайков или дизлайков поста при удалении лайка.
+
+    Срабатывает при любом удалении, в том числе каскадном (например, при удалении пользователя).
+    Условие на счетчик защищает от ухода в минус строк, счетчики которых еще не пересчитаны
+    (см. команду recount_likes).
+    """
+    field = 'like_count' if instance.is_like else 'dislike_count'
+    Post.objects.filter(pk=instance.post_id, **{f'{field}__gt': 0}).update(**{field: F(field) - 1})
+
+
+@receiver([post_save, post_delete], sender=User)
+def clear_cached_user_on_change(sender, instance, **kwargs):
+    """Удаляет пользователя из кеша JWT-аутентификации при его изменении или удалении."""
+    clear_user_cache(instance.pk)
@@ -1,8 +1,46 @@
+import json
+import time
+from io import StringIO
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
+from rest_framework.throttling import UserRateThrottle
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F, QuerySet
+from django.test.utils import CaptureQueriesContext
+from blog.authentication import CachedJWTAuthentication, clear_token_cache, clear_user_cache
+from blog.cache import POSTS_LIST_VERSION_KEY, invalidate_posts_list_cache, post_cache_key, posts_list_cache_version
 from blog.models import Post, Comment, Like, Category
+from blog.views import PostAPIDetail
+from blog_project.urls_ops import get_openapi_document
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Фикстура очистки кеша.
+
+    Очищает кеш, а также кеши токенов и пользователей JWT-аутентификации перед каждым тестом,
+    чтобы закешированные данные не переходили между тестами.
+    """
+    cache.clear()
+    clear_token_cache()
+    clear_user_cache()
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    """
+    Фикстура быстрого хеширования паролей.
+
+    Заменяет медленный PBKDF2 на MD5 в тестах: хеширование пароля при создании пользователя
+    и при получении JWT-токена составляет основную часть времени подготовки тестов.
+    """
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
 
 @pytest.fixture
@@ -68,12 +106,14 @@ def test_post_list(auth_client, create_post):
     Тестирование списка постов.
 
     Проверяет, что запрос GET на список постов возвращает успешный ответ (200 OK),
-    что в ответе присутствует ключ 'results' и что хотя бы один пост есть в списке.
+    что в ответе присутствует ключ 'results', что хотя бы один пост есть в списке
+    и что контент поста в списке не возвращается.
     """
     response = auth_client.get('/api/posts/')
     assert response.status_code == status.HTTP_200_OK
     assert 'results' in response.data
     assert len(response.data['results']) > 0  # Проверяем, что хотя бы 1 пост есть
+    assert 'content' not in response.data['results'][0]  # Контент в списке не отдается
 
 
 @pytest.mark.django_db
@@ -104,7 +144,81 @@ def test_post_detail(auth_client, create_post):
     """
     response = auth_client.get(f'/api/post/{create_post.id}/')
     assert response.status_code == status.HTTP_200_OK
-    assert response.data['title'] == 'Test Post'
+    assert response.json()['title'] == 'Test Post'
+
+
+@pytest.mark.django_db
+def test_post_detail_etag(auth_client, create_post, django_capture_on_commit_callbacks):
+    """
+    Тестирование условного GET-запроса для детального поста.
+
+    Проверяет, что ответ содержит ETag, повторный запрос с If-None-Match возвращает 304 Not Modified,
+    а после изменения поста ETag меняется.
+    """
+    response = auth_client.get(f'/api/post/{create_post.id}/')
+    etag = response['ETag']
+
+    response = auth_client.get(f'/api/post/{create_post.id}/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.post(f'/api/post/{create_post.id}/likes/', {'is_like': True}, format='json')
+    response = auth_client.get(f'/api/post/{create_post.id}/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['like_count'] == 1
+
+
+@pytest.mark.django_db
+def test_post_detail_not_modified_skips_throttle(auth_client, create_post, monkeypatch):
+    """
+    Тестирование троттлинга условных запросов к детальному посту.
+
+    Проверяет, что при исчерпанном лимите запросов условный GET-запрос с актуальным ETag
+    все равно получает 304 Not Modified, а обычный запрос и запрос на изменение с тем же ETag —
+    429 Too Many Requests.
+    """
+    monkeypatch.setattr(UserRateThrottle, 'THROTTLE_RATES', {'user': '1/min'})
+
+    response = auth_client.get(f'/api/post/{create_post.id}/')
+    etag = response['ETag']
+
+    response = auth_client.get(f'/api/post/{create_post.id}/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = auth_client.get(f'/api/post/{create_post.id}/')
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    # Совпадающий ETag не отключает троттлинг запросов на изменение
+    data = {'title': 'Updated Title', 'content': 'Updated Content', 'category': create_post.category_id}
+    response = auth_client.put(f'/api/post/{create_post.id}/', data, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+@pytest.mark.django_db
+def test_post_detail_throttle_configured(auth_client, create_post, create_user):
+    """
+    Тестирование настроенного лимита запросов к детальному посту.
+
+    Проверяет, что без подмены настроек запросы учитываются в истории троттлинга,
+    а условный запрос, получивший 304 Not Modified, в нее не попадает.
+    """
+    response = auth_client.get(f'/api/post/{create_post.id}/')
+    response = auth_client.get(f'/api/post/{create_post.id}/', HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert len(cache.get(f'throttle_user_{create_user.pk}')) == 1
+
+
+@pytest.mark.django_db
+def test_post_detail_writes_throttled(auth_client, create_post, create_user):
+    """
+    Тестирование лимита запросов на изменение поста.
+
+    Проверяет, что редактирование и удаление поста учитываются в том же лимите запросов, что и чтение.
+    """
+    data = {'title': 'Updated Title', 'content': 'Updated Content', 'category': create_post.category_id}
+    auth_client.put(f'/api/post/{create_post.id}/', data, format='json')
+    auth_client.delete(f'/api/post/{create_post.id}/')
+    assert len(cache.get(f'throttle_user_{create_user.pk}')) == 2
 
 
 @pytest.mark.django_db
@@ -120,11 +234,37 @@ def test_post_update(auth_client, create_post, create_category):
         'content': 'Updated Content',
         'category': create_category.id
     }
-    response = auth_client.put(f'/api/post_edit/{create_post.id}/', data, format='json')
+    response = auth_client.put(f'/api/post/{create_post.id}/', data, format='json')
     assert response.status_code == status.HTTP_200_OK
     assert response.data['title'] == 'Updated Title'
 
 
+@pytest.mark.django_db
+def test_post_update_keeps_counters(auth_client, create_post, create_category, monkeypatch):
+    """
+    Тестирование сохранения счетчиков при редактировании поста.
+
+    Проверяет, что голос и просмотр, учтенные между загрузкой поста и его сохранением при PUT,
+    не затираются значениями, прочитанными при загрузке.
+    """
+    original_get_object = PostAPIDetail.get_object
+
+    def get_object_then_vote(self):
+        post = original_get_object(self)
+        # Параллельный запрос успел учесть лайк и просмотр после загрузки поста
+        Post.objects.filter(pk=post.pk).update(like_count=F('like_count') + 1, views=F('views') + 1)
+        return post
+
+    monkeypatch.setattr(PostAPIDetail, 'get_object', get_object_then_vote)
+    data = {'title': 'Updated Title', 'content': 'Updated Content', 'category': create_category.id}
+    response = auth_client.put(f'/api/post/{create_post.id}/', data, format='json')
+    assert response.status_code == status.HTTP_200_OK
+
+    create_post.refresh_from_db()
+    assert create_post.title == 'Updated Title'
+    assert (create_post.like_count, create_post.views) == (1, 1)
+
+
 @pytest.mark.django_db
 def test_post_delete(auth_client, create_post):
     """
@@ -133,7 +273,7 @@ def test_post_delete(auth_client, create_post):
     Проверяет, что DELETE-запрос на удаление поста возвращает успешный ответ (204 No Content),
     и что пост действительно удален из базы данных.
     """
-    response = auth_client.delete(f'/api/post_edit/{create_post.id}/')
+    response = auth_client.delete(f'/api/post/{create_post.id}/')
     assert response.status_code == status.HTTP_204_NO_CONTENT
     assert Post.objects.filter(id=create_post.id).count() == 0
 
@@ -178,7 +318,7 @@ def test_comment_update(auth_client, create_comment):
         "post": create_comment.post.id  # ✅ Добавляем ID поста
     }
     response = auth_client.put(
-        f'/api/post/{create_comment.post.id}/comment_edit/{create_comment.id}/',
+        f'/api/post/{create_comment.post.id}/comment/{create_comment.id}/',
         data, format='json'
     )
     assert response.status_code == status.HTTP_200_OK
@@ -193,7 +333,7 @@ def test_comment_delete(auth_client, create_comment):
     и что комментарий действительно удален из базы данных.
     """
     response = auth_client.delete(
-        f'/api/post/{create_comment.post.id}/comment_edit/{create_comment.id}/'
+        f'/api/post/{create_comment.post.id}/comment/{create_comment.id}/'
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
     assert not Comment.objects.filter(id=create_comment.id).exists()  # Проверяем, что комментарий удалён
@@ -208,7 +348,7 @@ def test_like_post(auth_client, create_post):
     и что лайк был успешно добавлен.
     """
     data = {'is_like': True}
-    response = auth_client.post(f'/api/post/{create_post.id}/like/', data, format='json')
+    response = auth_client.post(f'/api/post/{create_post.id}/likes/', data, format='json')
     assert response.status_code in [status.HTTP_201_CREATED, status.HTTP_200_OK]
     assert Like.objects.filter(post=create_post).count() == 1
 
@@ -222,7 +362,7 @@ def test_dislike_post(auth_client, create_post):
     и что дизлайк был успешно добавлен.
     """
     data = {'is_like': False}
-    response = auth_client.post(f'/api/post/{create_post.id}/like/', data, format='json')
+    response = auth_client.post(f'/api/post/{create_post.id}/likes/', data, format='json')
     assert response.status_code in [status.HTTP_201_CREATED, status.HTTP_200_OK]
     assert Like.objects.filter(post=create_post).count() == 1
 
@@ -236,12 +376,29 @@ def test_post_like_count(auth_client, create_post, create_user):
     для лайков и дизлайков.
     """
     Like.objects.create(user=create_user, post=create_post, is_like=True)
-    response = auth_client.get(f'/api/post/{create_post.id}/likes_count/')
+    response = auth_client.get(f'/api/post/{create_post.id}/likes/')
     assert response.status_code == status.HTTP_200_OK
     assert response.data['like_count'] == 1
     assert response.data['dislike_count'] == 0
 
 
+@pytest.mark.django_db
+def test_post_likes_anonymous(create_post):
+    """
+    Тестирование доступа к лайкам поста без аутентификации.
+
+    Проверяет, что количество лайков доступно анонимному пользователю, а поставить оценку он не может.
+    """
+    client = APIClient()
+    response = client.get(f'/api/post/{create_post.id}/likes/')
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {'id': create_post.id, 'title': create_post.title, 'like_count': 0, 'dislike_count': 0}
+
+    response = client.post(f'/api/post/{create_post.id}/likes/', {'is_like': True}, format='json')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert not Like.objects.exists()
+
+
 @pytest.mark.django_db
 def test_jwt_auth():
     """
@@ -258,3 +415,408 @@ def test_jwt_auth():
     assert 'refresh' in response.data
 
 
+@pytest.mark.django_db
+def test_like_updates_post_counters(auth_client, create_post):
+    """
+    Тестирование денормализованных счетчиков лайков.
+
+    Проверяет, что лайк, повторный лайк и смена оценки на дизлайк корректно
+    обновляют счетчики и рейтинг поста.
+    """
+    url = f'/api/post/{create_post.id}/likes/'
+    auth_client.post(url, {'is_like': True}, format='json')
+    auth_client.post(url, {'is_like': True}, format='json')
+    create_post.refresh_from_db()
+    assert (create_post.like_count, create_post.dislike_count, create_post.rating) == (1, 0, 1)
+
+    auth_client.post(url, {'is_like': False}, format='json')
+    create_post.refresh_from_db()
+    assert (create_post.like_count, create_post.dislike_count, create_post.rating) == (0, 1, -1)
+
+
+@pytest.mark.django_db
+def test_like_concurrent_first_vote(auth_client, create_post, monkeypatch):
+    """
+    Тестирование гонки двух первых оценок одного пользователя.
+
+    Проверяет, что если лайк успел создать параллельный запрос (IntegrityError при создании),
+    транзакция повторяется и клиент получает успешный ответ, а счетчики не расходятся с лайками.
+    """
+    original_create = QuerySet.create
+    calls = []
+
+    def create_after_concurrent_vote(self, **kwargs):
+        if self.model is Like and not calls:
+            calls.append(kwargs)
+            # Лайк, созданный параллельным запросом между чтением с блокировкой и INSERT
+            Like.objects.bulk_create([Like(**kwargs)])
+        return original_create(self, **kwargs)
+
+    monkeypatch.setattr(QuerySet, 'create', create_after_concurrent_vote)
+    response = auth_client.post(f'/api/post/{create_post.id}/likes/', {'is_like': True}, format='json')
+    assert response.status_code in [status.HTTP_201_CREATED, status.HTTP_200_OK]
+    assert calls
+
+    create_post.refresh_from_db()
+    assert Like.objects.filter(post=create_post).count() == 1
+    assert (create_post.like_count, create_post.dislike_count) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_like_counters_on_cascade_delete(create_post):
+    """
+    Тестирование счетчиков лайков при каскадном удалении.
+
+    Проверяет, что при удалении пользователя его лайки удаляются, а счетчики поста уменьшаются.
+    """
+    voter = User.objects.create_user(username='voter', password='password')
+    client = APIClient()
+    client.force_authenticate(user=voter)
+    client.post(f'/api/post/{create_post.id}/likes/', {'is_like': True}, format='json')
+
+    voter.delete()
+    create_post.refresh_from_db()
+    assert not Like.objects.exists()
+    assert (create_post.like_count, create_post.dislike_count) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_like_counters_orm_and_api(auth_client, create_post):
+    """
+    Тестирование счетчиков лайков, созданных через ORM и через API.
+
+    Проверяет, что лайк, созданный через ORM, учитывается в счетчиках, а его удаление
+    не забирает голос, поставленный другим пользователем через API.
+    """
+    voter = User.objects.create_user(username='voter', password='password')
+    orm_like = Like.objects.create(user=voter, post=create_post, is_like=False)
+    auth_client.post(f'/api/post/{create_post.id}/likes/', {'is_like': True}, format='json')
+    create_post.refresh_from_db()
+    assert (create_post.like_count, create_post.dislike_count) == (1, 1)
+
+    orm_like.delete()
+    create_post.refresh_from_db()
+    assert (create_post.like_count, create_post.dislike_count) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_recount_likes_command(auth_client, create_post, create_user, django_capture_on_commit_callbacks):
+    """
+    Тестирование команды пересчета счетчиков лайков.
+
+    Проверяет, что команда recount_likes заполняет счетчики по таблице лайков
+    и удаляет устаревший пост из кеша.
+    """
+    response = auth_client.get(f'/api/post/{create_post.id}/')
+    etag = response['ETag']
+
+    # bulk_create не вызывает сигналы: так выглядят лайки, добавленные до появления счетчиков
+    Like.objects.bulk_create([Like(user=create_user, post=create_post, is_like=True)])
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command('recount_likes', stdout=StringIO())
+
+    response = auth_client.get(f'/api/post/{create_post.id}/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['like_count'] == 1
+
+
+@pytest.mark.django_db
+def test_like_status_and_missing_post(auth_client, create_post):
+    """
+    Тестирование статусов ответа при лайке.
+
+    Проверяет, что первый лайк возвращает 201 Created, смена и повтор оценки — 200 OK
+    (повтор выполняется одним запросом без записи), а лайк несуществующего поста — 404 Not Found.
+    """
+    url = f'/api/post/{create_post.id}/likes/'
+    assert auth_client.post(url, {'is_like': True}, format='json').status_code == status.HTTP_201_CREATED
+    assert auth_client.post(url, {'is_like': False}, format='json').status_code == status.HTTP_200_OK
+
+    with CaptureQueriesContext(connection) as queries:
+        response = auth_client.post(url, {'is_like': False}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(queries) == 1
+
+    response = auth_client.post(f'/api/post/{create_post.id + 1000}/likes/', {'is_like': True}, format='json')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert not Like.objects.filter(post_id=create_post.id + 1000).exists()
+
+
+@pytest.mark.django_db
+def test_comment_list_missing_post(auth_client):
+    """
+    Тестирование списка комментариев несуществующего поста.
+
+    Проверяет, что GET-запрос на комментарии несуществующего поста возвращает 404 Not Found.
+    """
+    response = auth_client.get('/api/post/999/comments/')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_post_list_count_query(auth_client, create_post):
+    """
+    Тестирование запроса подсчета постов для пагинации.
+
+    Проверяет, что список постов выполняется двумя запросами и что COUNT для пагинации
+    идет по таблице постов без JOIN и GROUP BY.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = auth_client.get('/api/posts/')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(queries) == 2
+    count_sql = queries[0]['sql']
+    assert 'COUNT(' in count_sql
+    assert 'JOIN' not in count_sql and 'GROUP BY' not in count_sql
+
+
+@pytest.mark.django_db
+def test_post_list_cache_invalidation(auth_client, create_post, create_category,
+                                      django_capture_on_commit_callbacks):
+    """
+    Тестирование инвалидации кеша списка постов.
+
+    Проверяет, что повторный запрос списка отдается из кеша без обращения к БД,
+    а после создания нового поста список сразу обновляется.
+    """
+    response = auth_client.get('/api/posts/')
+    assert response.data['count'] == 1
+
+    with CaptureQueriesContext(connection) as queries:
+        auth_client.get('/api/posts/')
+    assert len(queries) == 0
+
+    data = {'title': 'New Post', 'content': 'Content', 'category': create_category.id}
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.post('/api/posts/', data, format='json')
+    response = auth_client.get('/api/posts/')
+    assert response.data['count'] == 2
+
+
+@pytest.mark.django_db
+def test_vote_invalidates_cache_after_commit(auth_client, create_post, django_capture_on_commit_callbacks):
+    """
+    Тестирование момента инвалидации кеша при голосовании.
+
+    Проверяет, что создание и смена оценки сбрасывают кеш поста и списка постов
+    только после фиксации транзакции, а не внутри нее.
+    """
+    url = f'/api/post/{create_post.id}/likes/'
+    for is_like in (True, False):
+        auth_client.get(f'/api/post/{create_post.id}/')
+        version = posts_list_cache_version()
+        with django_capture_on_commit_callbacks() as callbacks:
+            auth_client.post(url, {'is_like': is_like}, format='json')
+        assert cache.get(post_cache_key(create_post.id)) is not None
+        assert posts_list_cache_version() == version
+
+        for callback in callbacks:
+            callback()
+        assert cache.get(post_cache_key(create_post.id)) is None
+        assert posts_list_cache_version() != version
+
+
+def test_posts_list_cache_version_not_reused():
+    """
+    Тестирование версии кеша списка постов после потери ключа версии.
+
+    Проверяет, что после вытеснения ключа версии новая версия больше прежней,
+    поэтому закешированные страницы прежних версий не отдаются снова.
+    """
+    version = posts_list_cache_version()
+    invalidate_posts_list_cache()
+    assert posts_list_cache_version() == version + 1
+
+    cache.delete(POSTS_LIST_VERSION_KEY)
+    invalidate_posts_list_cache()
+    assert posts_list_cache_version() > version + 1
+
+    cache.delete(POSTS_LIST_VERSION_KEY)
+    assert posts_list_cache_version() > version + 1
+
+
+@pytest.mark.django_db
+def test_post_list_cache_absolute_links(auth_client, create_post):
+    """
+    Тестирование ссылок пагинации в закешированном списке постов.
+
+    Проверяет, что запросы с разной схемой и путем не получают из кеша чужие ссылки next.
+    """
+    for i in range(5):
+        Post.objects.create(title=f'Post {i}', author=create_post.author, category=create_post.category)
+
+    response = auth_client.get('/api/posts', secure=True)
+    assert response.data['next'].startswith('https://testserver/api/posts?')
+
+    response = auth_client.get('/api/posts/')
+    assert response.data['next'].startswith('http://testserver/api/posts/?')
+
+
+@pytest.mark.django_db
+def test_jwt_user_cached(create_post):
+    """
+    Тестирование кеширования пользователя при JWT-аутентификации.
+
+    Проверяет, что повторный запрос с тем же JWT-токеном не выполняет запрос к таблице пользователей,
+    а после изменения пользователя он снова загружается из базы данных.
+    """
+    client = APIClient()
+    response = client.post('/api/token/', {'username': 'testuser', 'password': 'password'}, format='json')
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    url = f'/api/post/{create_post.id}/comments/'
+    client.get(url)
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get(url).status_code == status.HTTP_200_OK
+    assert not any('auth_user' in query['sql'] for query in queries)
+
+    create_post.author.is_active = False
+    create_post.author.save()
+    assert client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_jwt_user_cache_expires(create_post, monkeypatch):
+    """
+    Тестирование срока жизни кеша пользователя при JWT-аутентификации.
+
+    Проверяет, что изменение пользователя без сигналов (как в другом процессе) вступает в силу
+    после истечения USER_CACHE_TIMEOUT.
+    """
+    client = APIClient()
+    response = client.post('/api/token/', {'username': 'testuser', 'password': 'password'}, format='json')
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    url = f'/api/post/{create_post.id}/comments/'
+    client.get(url)
+    User.objects.filter(pk=create_post.author.pk).update(is_active=False)
+    assert client.get(url).status_code == status.HTTP_200_OK
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + CachedJWTAuthentication.USER_CACHE_TIMEOUT + 1)
+    assert client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_post_list_category_filter(auth_client, create_post, create_category):
+    """
+    Тестирование фильтрации постов по категории.
+
+    Проверяет фильтрацию по ID категории и по точному названию категории без учета регистра.
+    """
+    response = auth_client.get('/api/posts/', {'category': create_category.id})
+    assert response.data['count'] == 1
+    response = auth_client.get('/api/posts/', {'category': create_category.id + 1})
+    assert response.data['count'] == 0
+
+    response = auth_client.get('/api/posts/', {'category_name': 'test category'})
+    assert response.data['count'] == 1
+    response = auth_client.get('/api/posts/', {'category_name': 'Test'})
+    assert response.data['count'] == 0
+
+
+@pytest.mark.django_db
+def test_post_list_search(auth_client, create_post):
+    """
+    Тестирование поиска постов.
+
+    Проверяет, что параметр search находит посты по подстроке в заголовке и контенте без учета регистра.
+    """
+    Post.objects.create(title='Django tips', content='About views', author=create_post.author)
+    Post.objects.create(title='Other', content='Caching with django', author=create_post.author)
+
+    response = auth_client.get('/api/posts/', {'search': 'DJANGO'})
+    assert response.status_code == status.HTTP_200_OK
+    assert {post['title'] for post in response.data['results']} == {'Django tips', 'Other'}
+
+    response = auth_client.get('/api/posts/', {'search': 'views'})
+    assert [post['title'] for post in response.data['results']] == ['Django tips']
+
+    response = auth_client.get('/api/posts/', {'search': 'djan'})
+    assert {post['title'] for post in response.data['results']} == {'Django tips', 'Other'}
+
+
+@pytest.mark.django_db
+def test_comment_detail_wrong_post(auth_client, create_comment):
+    """
+    Тестирование доступа к комментарию через чужой пост.
+
+    Проверяет, что запрос к комментарию по ID поста, к которому он не относится,
+    возвращает 404 Not Found.
+    """
+    response = auth_client.get(f'/api/post/{create_comment.post.id + 1}/comment/{create_comment.id}/')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_api_paths_without_trailing_slash(auth_client, create_post):
+    """
+    Тестирование путей API без слеша в конце.
+
+    Проверяет, что запросы без слеша обрабатываются сразу, без редиректа на путь со слешем.
+    """
+    response = auth_client.get('/api/posts')
+    assert response.status_code == status.HTTP_200_OK
+
+    response = auth_client.get(f'/api/post/{create_post.id}')
+    assert response.status_code == status.HTTP_200_OK
+
+    response = auth_client.post(f'/api/post/{create_post.id}/likes', {'is_like': True}, format='json')
+    assert response.status_code == status.HTTP_201_CREATED
+    assert Like.objects.filter(post=create_post).count() == 1
+
+
+@pytest.mark.django_db
+def test_post_detail_permissions(create_post, create_category):
+    """
+    Тестирование прав доступа к детальному посту.
+
+    Проверяет, что читать пост может анонимный пользователь, а редактировать — только автор.
+    """
+    client = APIClient()
+    response = client.get(f'/api/post/{create_post.id}/')
+    assert response.status_code == status.HTTP_200_OK
+
+    data = {'title': 'Updated Title', 'content': 'Updated Content', 'category': create_category.id}
+    response = client.put(f'/api/post/{create_post.id}/', data, format='json')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    client.force_authenticate(user=User.objects.create_user(username='other', password='password'))
+    response = client.put(f'/api/post/{create_post.id}/', data, format='json')
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_swagger_openapi_document():
+    """
+    Тестирование OpenAPI-документа для Swagger UI.
+
+    Проверяет, что документ отдается готовым JSON и описывает пути API,
+    а GET лайков поста описан как объект со счетчиками, без пагинации.
+    """
+    response = APIClient().get('/swagger/?format=openapi')
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/openapi+json'
+    paths = response.json()['paths']
+    assert '/post/{id}/' in paths
+
+    likes_get = paths['/post/{id}/likes/']['get']
+    assert likes_get['parameters'] == []
+    assert set(likes_get['responses']['200']['schema']['properties']) == {
+        'id', 'title', 'like_count', 'dislike_count'
+    }
+
+
+def test_swagger_openapi_document_generation(caplog):
+    """
+    Тестирование построения OpenAPI-документа.
+
+    Проверяет, что представления не падают при генерации схемы (ошибки drf-yasg
+    попадали бы в лог при каждом запуске воркера), а ID в путях описаны как integer.
+    """
+    document = json.loads(get_openapi_document.__wrapped__())
+    assert not [record for record in caplog.records if record.exc_info]
+
+    parameters = document['paths']['/post/{id}/comment/{comment_pk}/']['parameters']
+    assert {parameter['name']: parameter['type'] for parameter in parameters} == {
+        'id': 'integer', 'comment_pk': 'integer'
+    }
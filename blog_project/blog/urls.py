@@ -0,0 +1,61 @@
+from django.urls import include, path, register_converter
+from rest_framework_simplejwt.views import TokenRefreshView, TokenObtainPairView
+
+from blog.converters import FastIntConverter
+from blog.views import (
+    PostAPIList,
+    PostAPIDetail,
+    CommentListCreate,
+    CommentRetrieveUpdateDestroy,
+    LikeAPIView,
+)
+
+
+# Конвертер ID постов и комментариев в путях
+register_converter(FastIntConverter, 'fastint')
+
+
+def slash_optional(route, view, name=None):
+    """
+    Возвращает пути для route со слешем в конце и без него.
+
+    Запрос без слеша сразу попадает в представление, без повторного разбора URL
+    и редиректа 301 от CommonMiddleware (APPEND_SLASH). Имя получает только путь со слешем.
+    """
+    return [path(route, view, name=name), path(route.removesuffix('/'), view)]
+
+
+post_detail_view = PostAPIDetail.as_view()
+
+# URL-пути API (подключаются в корневом URLconf с префиксом 'api/').
+# Резолвер перебирает пути сверху вниз, поэтому самые частые запросы идут первыми.
+# Все пути принимаются как со слешем в конце, так и без него.
+urlpatterns = [
+    # Путь для получения списка всех постов
+    *slash_optional('posts/', PostAPIList.as_view()),
+
+    # Пути для конкретного поста по ID: общий префикс проверяется одним регулярным выражением,
+    # после чего сопоставляются только короткие суффиксы
+    path('post/<fastint:pk>/', include([
+        # Путь для получения, редактирования и удаления поста
+        path('', post_detail_view),
+
+        # Путь для получения комментариев к посту и создания нового комментария
+        *slash_optional('comments/', CommentListCreate.as_view()),
+
+        # Путь для получения количества лайков и дизлайков у поста (GET) и постановки лайка или дизлайка (POST)
+        *slash_optional('likes/', LikeAPIView.as_view()),
+
+        # Путь для получения, редактирования или удаления комментария к посту по ID комментария
+        *slash_optional('comment/<fastint:comment_pk>/', CommentRetrieveUpdateDestroy.as_view()),
+    ])),
+
+    # Путь для поста без слеша в конце (не совпадает с префиксом выше)
+    path('post/<fastint:pk>', post_detail_view),
+
+    # Путь для получения токена (JWT) при аутентификации
+    *slash_optional('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+
+    # Путь для обновления токена (JWT)
+    *slash_optional('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+]
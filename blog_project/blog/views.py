@@ -1,21 +1,31 @@
-from django.db.models import Count, F, Q
-from django.shortcuts import get_object_or_404
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+import hashlib
+import json
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_etags, quote_etag, urlencode
 from django.core.cache import cache
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, status
 from rest_framework.exceptions import NotFound
 from rest_framework.filters import SearchFilter, OrderingFilter
-from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.throttling import UserRateThrottle
 
+from blog.authentication import CachedJWTAuthentication
+from blog.cache import post_cache_key, posts_list_cache_version, invalidate_post_caches_on_commit
 from blog.filters import PostFilter
 from blog.models import Post, Comment, Like
 from blog.permissions import IsAuthorOrReadOnly
-from blog.serializers import PostSerializer, CommentSerializer, LikeSerializer, PostLikeCountSerializer
+from blog.serializers import (
+    PostSerializer, PostListSerializer, CommentSerializer, LikeSerializer
+)
 
 
 class PostAPIList(generics.ListCreateAPIView):
@@ -26,91 +36,144 @@ class PostAPIList(generics.ListCreateAPIView):
     - Получение списка постов с фильтрацией, сортировкой и кешированием.
     - Создание нового поста с привязкой текущего пользователя как автора.
     """
-    queryset = Post.objects.all().select_related('author', 'category').prefetch_related('likes').annotate(
-        like_count=Count('likes', filter=Q(likes__is_like=True)),
-        dislike_count=Count('likes', filter=Q(likes__is_like=False)),
-        rating=F('like_count') - F('dislike_count')
+    queryset = Post.objects.all().select_related('author').only(
+        'id', 'title', 'category_id', 'author__username', 'time_create', 'views',
+        'like_count', 'dislike_count', 'rating'
     )
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = PostFilter
     search_fields = ['title', 'content']
     ordering_fields = ['time_create', 'title', 'rating']
     ordering = ['-time_create']
 
+    def get_serializer_class(self):
+        """
+        Возвращает облегченный сериализатор без контента поста для списка
+        и полный сериализатор для создания поста.
+        """
+        if self.request.method == 'GET':
+            return PostListSerializer
+        return super().get_serializer_class()
+
     def perform_create(self, serializer):
         """
         Сохраняет новый пост с автором, назначенным текущим пользователем.
         """
         serializer.save(author=self.request.user)
 
-    @method_decorator(cache_page(60 * 10))  # Кешируем на 10 минут
-    def get(self, request, *args, **kwargs):
+    def list(self, request, *args, **kwargs):
         """
-        Обрабатывает GET-запросы и возвращает список постов с кешированием.
+        Возвращает список постов с кешированием.
+
+        Ключ кеша строится из версии кеша списка, абсолютного URL без параметров и отсортированных
+        параметров запроса, поэтому URL с разным порядком параметров используют одну запись,
+        а любое изменение постов или лайков сразу инвалидирует все страницы. Схема, хост и путь
+        входят в ключ, так как ответ содержит абсолютные ссылки next и previous.
         """
-        return super().get(request, *args, **kwargs)
+        params = urlencode(sorted(request.query_params.lists()), doseq=True)
+        url = f'{request.build_absolute_uri(request.path)}?{params}'
+        cache_key = f'posts:{posts_list_cache_version()}:{hashlib.md5(url.encode()).hexdigest()}'
+        data = cache.get_or_set(
+            cache_key, lambda: super(PostAPIList, self).list(request, *args, **kwargs).data, timeout=600
+        )  # Кешируем на 10 минут
+        return Response(data)
 
 
-class PostAPIDetail(generics.RetrieveAPIView):
+class PostAPIDetail(generics.RetrieveUpdateDestroyAPIView):
     """
-    Представление для подробной информации о посте.
-
-    Этот класс обрабатывает запросы для получения данных о конкретном посте.
-    Используется кеширование для ускорения ответа на часто запрашиваемые посты.
+    Представление для получения, обновления и удаления поста.
+
+    Этот класс обрабатывает запросы для получения данных о конкретном посте,
+    а также запросы на его редактирование и удаление автором.
+    Для чтения используется кеширование и условные GET-запросы (ETag) для ускорения ответа
+    на часто запрашиваемые посты. После обновления или удаления поста его кеш удаляется.
+    Частота запросов пользователя ограничивается (UserRateThrottle, лимит 'user' из DEFAULT_THROTTLE_RATES)
+    для всех методов: редактирование и удаление учитываются в том же лимите, что и чтение,
+    чтобы ограничить и частые изменения поста. Без ограничения отдаются только ответы 304 Not Modified.
     """
-    queryset = Post.objects.all().select_related('author', 'category').prefetch_related('likes')
+    queryset = Post.objects.all().select_related('author', 'category')
     serializer_class = PostSerializer
-    permission_classes = [IsAuthenticatedOrReadOnly]
-    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAuthorOrReadOnly]
+    authentication_classes = [CachedJWTAuthentication]
     throttle_classes = [UserRateThrottle]
 
-    def retrieve(self, request, *args, **kwargs):
+    def get_permissions(self):
         """
-        Возвращает подробную информацию о посте.
-        Если данные уже в кеше, возвращает их из кеша.
+        Разрешает чтение поста всем, а редактирование и удаление — только автору.
         """
-        post_id = kwargs['pk']
-        cache_key = f'post_{post_id}'
-
-        # Проверяем, есть ли пост в кеше
-        post_data = cache.get(cache_key)
-        if post_data:
-            return Response(post_data)  # Если есть в кеше, сразу отдаем
+        if self.request.method in SAFE_METHODS:
+            return [IsAuthenticatedOrReadOnly()]
+        return super().get_permissions()
 
-        # Если нет в кеше, берем из БД
-        response = super().retrieve(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=600)  # Кешируем на 10 минут
+    def get_cached_post(self):
+        """
+        Возвращает закешированный ответ для поста или None.
 
-        return response
+        Результат запоминается на время запроса, чтобы проверка троттлинга и retrieve
+        обращались к кешу один раз.
+        """
+        if not hasattr(self, '_cached_post'):
+            self._cached_post = cache.get(post_cache_key(self.kwargs['pk']))
+        return self._cached_post
 
+    def get_throttles(self):
+        """
+        Отключает троттлинг для условных GET- и HEAD-запросов, на которые будет отдан 304 Not Modified,
+        чтобы они не обращались к кешу троттлинга. Запросы на изменение троттлятся всегда,
+        даже с совпадающим If-None-Match.
+        """
+        if self.request.method in ('GET', 'HEAD'):
+            etags = parse_etags(self.request.META.get('HTTP_IF_NONE_MATCH', ''))
+            if etags:
+                cached = self.get_cached_post()
+                if cached is not None and ('*' in etags or cached['etag'] in etags):
+                    return []
+        return super().get_throttles()
 
-class PostAPIUpdateDelete(generics.RetrieveUpdateDestroyAPIView):
-    """
-    Представление для обновления или удаления поста.
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Возвращает подробную информацию о посте.
 
-    Этот класс обрабатывает запросы на редактирование и удаление постов.
-    После обновления или удаления поста соответствующие данные удаляются из кеша.
-    """
-    queryset = Post.objects.all()
-    serializer_class = PostSerializer
-    permission_classes = [IsAuthenticated, IsAuthorOrReadOnly]
-    authentication_classes = [JWTAuthentication]
+        Ответ кешируется в виде готового JSON вместе с его ETag: повторные запросы
+        отдаются из кеша без сериализации и рендеринга, а условные запросы
+        с совпадающим If-None-Match получают 304 Not Modified.
+        """
+        # Проверяем, есть ли пост в кеше
+        cached = self.get_cached_post()
+        if cached is None:
+            # Если нет в кеше, берем из БД и кешируем готовый JSON на 10 минут
+            response = super().retrieve(request, *args, **kwargs)
+            content = JSONRenderer().render(response.data)
+            cached = {'etag': quote_etag(hashlib.md5(content).hexdigest()), 'content': content}
+            cache.set(post_cache_key(kwargs['pk']), cached, timeout=600)
+
+        not_modified = get_conditional_response(request, etag=cached['etag'])
+        if not_modified is not None:
+            not_modified['ETag'] = cached['etag']
+            return not_modified
+
+        if isinstance(request.accepted_renderer, JSONRenderer):
+            response = HttpResponse(cached['content'], content_type='application/json')
+        else:
+            response = Response(json.loads(cached['content']))
+        response['ETag'] = cached['etag']
+        return response
 
     def perform_update(self, serializer):
         """
         Удаляет кеш для измененного поста после обновления.
         """
         instance = serializer.save()
-        cache.delete(f'post_{instance.id}')  # Удаляем кеш только для измененного поста
+        cache.delete(post_cache_key(instance.id))  # Удаляем кеш только для измененного поста
 
     def perform_destroy(self, instance):
         """
         Удаляет кеш для удаленного поста и сам пост из базы данных.
         """
-        cache.delete(f'post_{instance.id}')  # Удаляем кеш только для удаленного поста
+        cache.delete(post_cache_key(instance.id))  # Удаляем кеш только для удаленного поста
         instance.delete()
 
 
@@ -123,16 +186,35 @@ class CommentListCreate(generics.ListCreateAPIView):
     """
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_queryset(self):
         """
-        Возвращает комментарии для конкретного поста, проверяя его существование.
+        Возвращает комментарии для конкретного поста.
         """
-        post_id = self.kwargs['pk']
-        if not Post.objects.filter(id=post_id).exists():
+        if getattr(self, 'swagger_fake_view', False):
+            return Comment.objects.none()  # Генерация схемы Swagger: ID поста в URL нет
+        return Comment.objects.filter(post_id=self.kwargs['pk']).select_related('author').only(
+            'id', 'content', 'created_at', 'post_id', 'author__username'
+        ).order_by('-created_at')
+
+    def list(self, request, *args, **kwargs):
+        """
+        Возвращает список комментариев к посту.
+
+        Существование поста проверяется отдельным запросом только тогда, когда комментариев нет:
+        если они есть, пост заведомо существует.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        comments = page if page is not None else queryset
+        if not comments and not Post.objects.filter(id=self.kwargs['pk']).exists():
             raise NotFound("Такого поста не существует.")
-        return Comment.objects.filter(post_id=post_id).select_related('author').order_by('-created_at')
+
+        serializer = self.get_serializer(comments, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
     def perform_create(self, serializer):
         """
@@ -146,58 +228,138 @@ class CommentRetrieveUpdateDestroy(generics.RetrieveUpdateDestroyAPIView):
     Представление для получения, обновления или удаления комментария.
 
     Этот класс обрабатывает запросы для работы с отдельными комментариями.
+    ID поста передается в URL как pk, ID комментария — как comment_pk.
     """
-    queryset = Comment.objects.all()
+    queryset = Comment.objects.select_related('author', 'post')
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsAuthorOrReadOnly]  # Только автор может редактировать/удалять
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
+    lookup_url_kwarg = 'comment_pk'
+
+    def get_queryset(self):
+        """
+        Возвращает комментарии поста, указанного в URL.
+        """
+        if getattr(self, 'swagger_fake_view', False):
+            return Comment.objects.none()  # Генерация схемы Swagger: ID поста в URL нет
+        return super().get_queryset().filter(post_id=self.kwargs['pk'])
 
 
 class LikeAPIView(generics.CreateAPIView):
     """
-    Представление для добавления или обновления лайков на постах.
+    Представление для лайков поста.
 
-    Этот класс обрабатывает запросы для создания лайков или дизлайков.
-    Пользователь может поставить лайк или дизлайк для поста.
+    Этот класс обрабатывает запросы на получение количества лайков и дизлайков поста (GET)
+    и запросы для создания или обновления лайков и дизлайков (POST).
+    Количество оценок может получить любой пользователь, а поставить оценку — только аутентифицированный.
     """
-    queryset = Like.objects.all().select_related('user', 'post')  # Оптимизация
+    queryset = Like.objects.all()
     serializer_class = LikeSerializer
-    permission_classes = [IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    authentication_classes = [CachedJWTAuthentication]
+    pagination_class = None  # GET возвращает счетчики одного поста, а не список лайков
+
+    # Сообщение и статус ответа для каждого результата perform_create
+    RESULT_RESPONSES = {
+        'created': ("Лайк добавлен", status.HTTP_201_CREATED),
+        'updated': ("Лайк обновлен", status.HTTP_200_OK),
+        'unchanged': ("Оценка не изменилась", status.HTTP_200_OK),
+    }
+
+    @swagger_auto_schema(responses={200: openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+            'title': openapi.Schema(type=openapi.TYPE_STRING),
+            'like_count': openapi.Schema(type=openapi.TYPE_INTEGER),
+            'dislike_count': openapi.Schema(type=openapi.TYPE_INTEGER),
+        },
+    )})
+    def get(self, request, pk):
+        """
+        Возвращает ID, заголовок и количество лайков и дизлайков поста.
+
+        Данные выбираются одним запросом values() по счетчикам поста, без создания экземпляра модели
+        и без сериализатора.
+        """
+        row = Post.objects.filter(pk=pk).values('id', 'title', 'like_count', 'dislike_count').first()
+        if row is None:
+            raise NotFound("Такого поста не существует.")
+        return Response(row)
+
+    def create(self, request, *args, **kwargs):
+        """
+        Обрабатывает POST-запрос на лайк или дизлайк.
+
+        Возвращает 201 Created, если оценка добавлена впервые, и 200 OK, если она обновлена
+        или совпадает с уже поставленной.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        message, status_code = self.RESULT_RESPONSES[self.perform_create(serializer)]
+        return Response({"message": message}, status=status_code)
 
     def perform_create(self, serializer):
         """
         Добавляет или обновляет лайк для указанного поста.
+
+        Повторная оценка с тем же значением определяется одним SELECT без блокировок и записи.
+        Иначе оценка сохраняется методом save_vote.
+
+        Возвращаемое значение:
+        - 'created', 'updated' или 'unchanged'.
         """
-        post = get_object_or_404(Post, id=self.kwargs['pk'])
+        post_id = self.kwargs['pk']
         user = self.request.user
-        is_like = self.request.data.get('is_like')
+        is_like = serializer.validated_data['is_like']
 
-        if is_like is None:
-            return Response({"error": "Поле 'is_like' обязательно"}, status=status.HTTP_400_BAD_REQUEST)
+        existing = Like.objects.filter(user=user, post_id=post_id).only('id', 'is_like').first()
+        if existing is not None and existing.is_like == is_like:
+            return 'unchanged'
 
-        # Используем update_or_create для упрощения логики
-        obj, created = Like.objects.update_or_create(
-            user=user, post=post,
-            defaults={"is_like": is_like}
-        )
-        return Response(
-            {"message": "Лайк обновлен" if not created else "Лайк добавлен"},
-            status=status.HTTP_200_OK if not created else status.HTTP_201_CREATED
-        )
+        try:
+            return self.save_vote(post_id, user, is_like)
+        except IntegrityError:
+            # Первую оценку параллельно создал другой запрос того же пользователя (например, двойной клик):
+            # select_for_update не блокирует еще не существующую строку. Транзакция откатилась целиком,
+            # повторяем ее — теперь созданный лайк будет прочитан с блокировкой
+            return self.save_vote(post_id, user, is_like)
 
+    def save_vote(self, post_id, user, is_like):
+        """
+        Сохраняет оценку пользователя и обновляет счетчики поста в одной транзакции.
 
-class PostLikeCountAPIView(generics.RetrieveAPIView):
-    """
-    Представление для получения количества лайков и дизлайков для поста.
+        Прежняя оценка перечитывается с блокировкой. Новая оценка учитывается в счетчиках поста
+        сигналом post_save лайка (как и удаление — сигналом post_delete), а при смене оценки
+        голос переносится между счетчиками атомарным UPDATE через F-выражения.
+
+        Возвращаемое значение:
+        - 'created', 'updated' или 'unchanged'.
+        """
+        with transaction.atomic():
+            previous = Like.objects.select_for_update().filter(user=user, post_id=post_id).values_list(
+                'is_like', flat=True
+            ).first()
+
+            if previous is None:
+                # Несуществующий пост проверяется заранее: нарушение внешнего ключа
+                # обнаружилось бы только при фиксации транзакции
+                if not Post.objects.filter(pk=post_id).exists():
+                    raise NotFound("Такого поста не существует.")
+                Like.objects.create(user=user, post_id=post_id, is_like=is_like)
+                return 'created'
+
+            if previous == is_like:
+                return 'unchanged'  # Оценку успели изменить параллельным запросом
+
+            # Переносим голос из одного счетчика в другой
+            delta = 1 if is_like else -1
+            Post.objects.filter(pk=post_id).update(
+                like_count=F('like_count') + delta,
+                dislike_count=F('dislike_count') - delta
+            )
+            Like.objects.filter(user=user, post_id=post_id).update(is_like=is_like)
+            # Счетчики изменились, кеш поста и списка постов устарел (сбрасывается после фиксации)
+            invalidate_post_caches_on_commit(post_id)
+            return 'updated'
 
-    Этот класс обрабатывает запросы на получение статистики лайков и дизлайков для конкретного поста.
-    """
-    queryset = Post.objects.all().annotate(
-        like_count=Count('likes', filter=Q(likes__is_like=True)),
-        dislike_count=Count('likes', filter=Q(likes__is_like=False)),
-        rating=F('like_count') - F('dislike_count')
-    )
-    serializer_class = PostLikeCountSerializer
-    permission_classes = [IsAuthenticatedOrReadOnly]
-    authentication_classes = [JWTAuthentication]
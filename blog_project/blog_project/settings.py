@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 import sys
+from datetime import timedelta
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -54,7 +56,9 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',  # Защита от clickjacking
 ]
 
-ROOT_URLCONF = 'blog_project.urls'  # Корневой файл конфигурации URL
+# Корневой файл конфигурации URL. Для раздельного запуска API и служебных путей процессам
+# задается blog_project.urls_api или blog_project.urls_ops через переменную окружения
+ROOT_URLCONF = os.environ.get('DJANGO_ROOT_URLCONF', 'blog_project.urls')
 
 # Templates
 # Конфигурация для шаблонов Django
@@ -142,10 +146,33 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',  # Пагинация
     'PAGE_SIZE': 5,  # Размер страницы
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',  # Используем JWT для аутентификации
+        'blog.authentication.CachedJWTAuthentication',  # Используем JWT для аутентификации с кешированием пользователя
     ],
+    # Лимит запросов пользователя для представлений с UserRateThrottle (детальный пост).
+    # Без лимита UserRateThrottle пропускает все запросы, не обращаясь к кешу
+    'DEFAULT_THROTTLE_RATES': {
+        'user': '100/minute',
+    },
+}
+
+# Simple JWT settings
+# Конфигурация JWT-токенов. HS256 (HMAC) проверяется быстрее любых асимметричных алгоритмов
+# (RS256, ES256, EdDSA), а токены выпускает и проверяет только этот сервис, поэтому
+# открытый ключ для сторонних проверяющих не нужен.
+# Токены проверяются локально по подписи, без обращения к внешнему сервису (интроспекции или JWKS),
+# поэтому отозвать access-токен нельзя — его срок жизни держим коротким.
+SIMPLE_JWT = {
+    'ALGORITHM': 'HS256',  # Алгоритм подписи токенов
+    'SIGNING_KEY': SECRET_KEY,  # Ключ подписи (общий секрет)
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),  # Срок жизни access-токена
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=1),  # Срок жизни refresh-токена
 }
 
+# Адрес API (схема и хост, например https://api.example.com) для документации Swagger.
+# Нужен, когда документация обслуживается отдельным процессом на другом порту (blog_project.urls_ops).
+# Пустая строка — хост в документе не указывается, Swagger UI обращается к хосту, с которого загружен документ
+SWAGGER_BASE_URL = os.environ.get('SWAGGER_BASE_URL', '')
+
 SWAGGER_SETTINGS = {
     'SECURITY_DEFINITIONS': {
         'Bearer': {
@@ -0,0 +1,14 @@
+"""
+URL-конфигурация API-процессов.
+
+Содержит только пути API, поэтому процесс, обслуживающий API (DJANGO_ROOT_URLCONF=blog_project.urls_api),
+не проверяет пути административной панели и документации при разборе запросов.
+"""
+
+from django.urls import include, path
+
+
+urlpatterns = [
+    # Пути API приложения blog (посты, комментарии, лайки, JWT-токены)
+    path('api/', include('blog.urls')),
+]
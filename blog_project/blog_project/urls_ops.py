@@ -0,0 +1,118 @@
+"""
+URL-конфигурация служебных путей: документация Swagger и административная панель.
+
+Эти пути можно обслуживать отдельным процессом на внутреннем порту (DJANGO_ROOT_URLCONF=blog_project.urls_ops),
+чтобы они не участвовали в разборе запросов к API.
+"""
+
+from functools import cache
+
+from django.conf import settings
+from django.contrib import admin
+from django.http import HttpRequest, HttpResponse
+from django.urls import path
+
+
+@cache
+def get_api_info():
+    """Возвращает описание API для документации Swagger."""
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="Blog API",
+        default_version='v1',
+        description="API documentation for the blog project",
+        terms_of_service="https://www.google.com/policies/terms/",
+        contact=openapi.Contact(email="contact@myblogapi.com"),
+        license=openapi.License(name="MIT License"),
+    )
+
+
+@cache
+def get_swagger_ui_view():
+    """
+    Создает представление Swagger UI при первом обращении.
+
+    drf-yasg, описание схемы и класс аутентификации импортируются только здесь,
+    поэтому загрузка URLconf (воркеры, manage.py) не платит за них, пока документация не запрошена.
+    """
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    from blog.authentication import CachedJWTAuthentication
+    from blog_project.urls_api import urlpatterns as api_urlpatterns
+
+    # Настройка схемы Swagger
+    schema_view = get_schema_view(
+        get_api_info(),
+        # Адрес API задается настройкой, поэтому хост не вычисляется из запроса
+        url=settings.SWAGGER_BASE_URL,
+        # Документируем только пути API, независимо от того, какой URLconf обслуживает этот процесс
+        patterns=api_urlpatterns,
+        public=True,
+        permission_classes=(permissions.AllowAny,),  # Разрешаем доступ к документации для всех
+        authentication_classes=[CachedJWTAuthentication],
+    )
+    # Страница Swagger UI кешируется на час
+    return schema_view.with_ui('swagger', cache_timeout=3600, cache_kwargs={'key_prefix': 'swagger'})
+
+
+@cache
+def get_openapi_document():
+    """
+    Строит OpenAPI-документ API и возвращает его в виде JSON (bytes).
+
+    Документ не зависит от запроса, поэтому строится один раз на процесс
+    (при запуске, см. blog_project.warmup) и дальше отдается готовым.
+    """
+    from drf_yasg import openapi
+    from drf_yasg.codecs import OpenAPICodecJson
+    from drf_yasg.generators import OpenAPISchemaGenerator
+    from rest_framework.request import Request
+
+    from blog_project.urls_api import urlpatterns as api_urlpatterns
+
+    class CanonicalPathsSchemaGenerator(OpenAPISchemaGenerator):
+        """
+        Генератор схемы, описывающий только пути со слешем в конце (пути без слеша — их копии).
+
+        Все параметры путей API — целочисленные ID (конвертер fastint), поэтому они описываются
+        как integer, даже если имя параметра (например, comment_pk) не совпадает с полем модели.
+        """
+
+        def get_endpoints(self, request):
+            endpoints = super().get_endpoints(request)
+            return {path: endpoint for path, endpoint in endpoints.items() if path.endswith('/')}
+
+        def get_path_parameters(self, path, view_cls):
+            parameters = super().get_path_parameters(path, view_cls)
+            for parameter in parameters:
+                parameter.type = openapi.TYPE_INTEGER
+                parameter.pop('pattern', None)
+            return parameters
+
+    # Представления при описании выбирают сериализатор по методу запроса, поэтому нужен запрос-заготовка
+    request = Request(HttpRequest())
+    request.method = 'GET'
+    generator = CanonicalPathsSchemaGenerator(get_api_info(), url=settings.SWAGGER_BASE_URL, patterns=api_urlpatterns)
+    return OpenAPICodecJson(validators=[]).encode(generator.get_schema(request=request, public=True))
+
+
+def swagger_ui_view(request, *args, **kwargs):
+    """
+    Отдает документацию Swagger, создавая представление при первом запросе.
+
+    Сам OpenAPI-документ (?format=openapi), который загружает Swagger UI, отдается готовым.
+    """
+    if request.GET.get('format') == 'openapi':
+        return HttpResponse(get_openapi_document(), content_type='application/openapi+json')
+    return get_swagger_ui_view()(request, *args, **kwargs)
+
+# Служебные URL-пути
+urlpatterns = [
+    # Путь для документации Swagger
+    path('swagger/', swagger_ui_view, name='schema-swagger-ui'),
+
+    # Путь к административной панели Django
+    path('admin/', admin.site.urls),
+]
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.urls import NoReverseMatch, get_resolver, reverse
+from django.utils import translation
+
+
+def warm_up_url_resolver():
+    """
+    Заполняет кеши корневого URL-резолвера до приема запросов.
+
+    Django строит reverse_dict и namespace_dict лениво при первом обращении, под блокировкой,
+    поэтому первый запрос каждого воркера платит за загрузку URLconf и заполнение кешей.
+    reverse_dict хранится отдельно для каждого языка, поэтому при включенном LocaleMiddleware
+    заполняется для всех языков из LANGUAGES, а иначе — только для LANGUAGE_CODE.
+    """
+    resolver = get_resolver()
+    resolver.url_patterns
+    languages = [settings.LANGUAGE_CODE]
+    if settings.USE_I18N and 'django.middleware.locale.LocaleMiddleware' in settings.MIDDLEWARE:
+        languages = [code for code, name in settings.LANGUAGES]
+    for language in languages:
+        with translation.override(language):
+            resolver.reverse_dict
+            resolver.namespace_dict
+            resolver.app_dict
+
+
+def warm_up_openapi_document():
+    """
+    Строит OpenAPI-документ до приема запросов, если процесс обслуживает документацию Swagger.
+
+    Иначе документ строился бы первым запросом к документации в каждом воркере,
+    и при одновременных запросах несколько воркеров строили бы его параллельно.
+    """
+    try:
+        reverse('schema-swagger-ui')
+    except NoReverseMatch:
+        return
+
+    from blog_project.urls_ops import get_openapi_document
+
+    get_openapi_document()
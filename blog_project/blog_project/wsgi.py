@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog_project.settings')
 
 application = get_wsgi_application()
+
+# Заполняем кеши URL-резолвера и строим OpenAPI-документ до первого запроса
+from blog_project.warmup import warm_up_openapi_document, warm_up_url_resolver  # noqa: E402
+
+warm_up_url_resolver()
+warm_up_openapi_document()